@@ -0,0 +1,344 @@
+from typing import List
+import sys
+
+from models import Difficulty, Lesson, Quiz, QuizQuestion
+
+
+# ============== DATA ==============
+# Author-controlled literals: built with model_construct to skip validation
+# at import. Request bodies (QuizSubmission, QuizAnswer) are still validated.
+
+
+def _interned(strings: List[str]) -> List[str]:
+    """Intern strings so repeats across lessons share one object"""
+    return [sys.intern(s) for s in strings]
+
+
+lessons_db = [
+    Lesson.model_construct(
+        id=1,
+        title="Introduction to Classes and Objects",
+        difficulty=Difficulty.BEGINNER,
+        content="""
+Classes are blueprints for creating objects. An object is an instance of a class.
+A class defines attributes (data) and methods (functions) that objects of that class will have.
+
+Key Points:
+- A class is a template
+- An object is a concrete instance created from a class
+- Classes group related data and behavior together
+- This helps organize code and make it reusable
+        """,
+        code_example="""
+class Dog:
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+    def bark(self):
+        return f"{self.name} says: Woof!"
+
+# Creating objects (instances)
+dog1 = Dog("Buddy", 3)
+dog2 = Dog("Max", 5)
+
+print(dog1.bark())  # Output: Buddy says: Woof!
+print(dog2.bark())  # Output: Max says: Woof!
+        """,
+        key_concepts=_interned(["Class", "Object", "Instance", "Attributes", "Methods", "Constructor"])
+    ),
+    Lesson.model_construct(
+        id=2,
+        title="Inheritance",
+        difficulty=Difficulty.INTERMEDIATE,
+        content="""
+Inheritance allows a class to inherit attributes and methods from another class.
+The class being inherited from is called the parent (or base) class.
+The class that inherits is called the child (or derived) class.
+
+Benefits:
+- Code reusability: avoid repeating code
+- Logical structure: represent real-world relationships
+- Polymorphism: child classes can override parent methods
+        """,
+        code_example="""
+class Animal:
+    def __init__(self, name):
+        self.name = name
+
+    def make_sound(self):
+        return "Some generic sound"
+
+class Dog(Animal):
+    def make_sound(self):
+        return f"{self.name} says: Woof!"
+
+class Cat(Animal):
+    def make_sound(self):
+        return f"{self.name} says: Meow!"
+
+# Both inherit from Animal
+dog = Dog("Buddy")
+cat = Cat("Whiskers")
+
+print(dog.make_sound())  # Buddy says: Woof!
+print(cat.make_sound())  # Whiskers says: Meow!
+        """,
+        key_concepts=_interned(["Inheritance", "Parent Class", "Child Class", "Override", "super()"])
+    ),
+    Lesson.model_construct(
+        id=3,
+        title="Encapsulation",
+        difficulty=Difficulty.INTERMEDIATE,
+        content="""
+Encapsulation is the bundling of data (attributes) and methods into a single unit (class).
+It also involves hiding internal details from the outside world using access modifiers.
+
+In Python:
+- Public: accessible from anywhere (no prefix)
+- Protected: intended for internal use (_prefix)
+- Private: not accessible outside the class (__prefix)
+
+Benefits:
+- Data protection: control how data is accessed and modified
+- Data hiding: expose only necessary interfaces
+- Maintainability: change internal implementation without affecting external code
+        """,
+        code_example="""
+class BankAccount:
+    def __init__(self, balance):
+        self.__balance = balance  # Private attribute
+
+    def deposit(self, amount):
+        if amount > 0:
+            self.__balance += amount
+            return f"Deposited: ${amount}"
+        return "Invalid amount"
+
+    def withdraw(self, amount):
+        if 0 < amount <= self.__balance:
+            self.__balance -= amount
+            return f"Withdrew: ${amount}"
+        return "Insufficient funds"
+
+    def get_balance(self):
+        return self.__balance
+
+account = BankAccount(1000)
+print(account.deposit(500))  # Deposited: $500
+print(account.get_balance())  # 1500
+# account.__balance = -1000  # Error: Cannot access private attribute
+        """,
+        key_concepts=_interned(["Encapsulation", "Access Modifiers", "Private", "Protected", "Public", "Getters", "Setters"])
+    ),
+    Lesson.model_construct(
+        id=4,
+        title="Polymorphism",
+        difficulty=Difficulty.ADVANCED,
+        content="""
+Polymorphism means "many forms". It allows objects of different types to be treated as objects of a common parent type.
+There are two main types: compile-time (method overloading) and runtime (method overriding).
+
+Benefits:
+- Write flexible and reusable code
+- Use a single interface for different data types
+- Makes code extensible and maintainable
+        """,
+        code_example="""
+class Shape:
+    def area(self):
+        pass
+
+class Circle(Shape):
+    def __init__(self, radius):
+        self.radius = radius
+
+    def area(self):
+        return 3.14 * self.radius ** 2
+
+class Rectangle(Shape):
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+# Polymorphism in action
+shapes = [Circle(5), Rectangle(4, 6)]
+
+for shape in shapes:
+    print(f"Area: {shape.area()}")  # Calls appropriate method
+        """,
+        key_concepts=_interned(["Polymorphism", "Method Overriding", "Interface", "Dynamic Dispatch"])
+    ),
+    Lesson.model_construct(
+        id=5,
+        title="Abstraction",
+        difficulty=Difficulty.ADVANCED,
+        content="""
+Abstraction is the concept of hiding complex implementation details and showing only the necessary features.
+It focuses on what an object does rather than how it does it.
+
+In Python, we use abstract classes and abstract methods to enforce abstraction.
+
+Benefits:
+- Reduce complexity by hiding implementation details
+- Define a clear interface for subclasses
+- Enforce consistency across implementations
+        """,
+        code_example="""
+from abc import ABC, abstractmethod
+
+class Vehicle(ABC):
+    @abstractmethod
+    def start(self):
+        pass
+
+    @abstractmethod
+    def stop(self):
+        pass
+
+class Car(Vehicle):
+    def start(self):
+        return "Car engine started"
+
+    def stop(self):
+        return "Car engine stopped"
+
+class Bike(Vehicle):
+    def start(self):
+        return "Bike engine started"
+
+    def stop(self):
+        return "Bike engine stopped"
+
+# Cannot instantiate abstract class
+# vehicle = Vehicle()  # Error
+
+car = Car()
+print(car.start())  # Car engine started
+        """,
+        key_concepts=_interned(["Abstraction", "Abstract Class", "Abstract Method", "ABC", "Interface"])
+    )
+]
+
+quizzes_db = [
+    Quiz.model_construct(
+        id=1,
+        lesson_id=1,
+        title="Classes and Objects Quiz",
+        questions=[
+            QuizQuestion.model_construct(
+                id=1,
+                question="What is a class in OOP?",
+                options=[
+                    "An instance of an object",
+                    "A blueprint for creating objects",
+                    "A method of a program",
+                    "A type of variable"
+                ],
+                correct_answer=1,
+                explanation="A class is a blueprint or template that defines the structure and behavior for objects."
+            ),
+            QuizQuestion.model_construct(
+                id=2,
+                question="What is an object?",
+                options=[
+                    "A collection of variables",
+                    "An instance of a class",
+                    "A function definition",
+                    "A data type"
+                ],
+                correct_answer=1,
+                explanation="An object is a concrete instance created from a class. It has actual values for the attributes defined in the class."
+            ),
+            QuizQuestion.model_construct(
+                id=3,
+                question="What does __init__ do in a class?",
+                options=[
+                    "Initializes the program",
+                    "Deletes an object",
+                    "Constructs and initializes a new object",
+                    "Returns a value"
+                ],
+                correct_answer=2,
+                explanation="__init__ is the constructor method that initializes a new object when it's created."
+            )
+        ]
+    ),
+    Quiz.model_construct(
+        id=2,
+        lesson_id=2,
+        title="Inheritance Quiz",
+        questions=[
+            QuizQuestion.model_construct(
+                id=1,
+                question="What is inheritance?",
+                options=[
+                    "Passing money to children",
+                    "A child class inheriting attributes and methods from a parent class",
+                    "Creating multiple objects",
+                    "Copying code from one file to another"
+                ],
+                correct_answer=1,
+                explanation="Inheritance allows a class (child) to inherit attributes and methods from another class (parent)."
+            ),
+            QuizQuestion.model_construct(
+                id=2,
+                question="What is the main benefit of inheritance?",
+                options=[
+                    "It makes code longer",
+                    "It helps organize imports",
+                    "Code reusability and logical structure",
+                    "It slows down execution"
+                ],
+                correct_answer=2,
+                explanation="Inheritance promotes code reusability and creates a logical hierarchical structure."
+            )
+        ]
+    )
+]
+
+
+learning_path = {
+    "title": "Complete OOP Learning Path",
+    "description": "A recommended progression to learn OOP concepts",
+    "path": [
+        {
+            "step": 1,
+            "lesson_id": 1,
+            "title": "Introduction to Classes and Objects",
+            "difficulty": "beginner",
+            "time_estimate": "30 minutes"
+        },
+        {
+            "step": 2,
+            "lesson_id": 2,
+            "title": "Inheritance",
+            "difficulty": "intermediate",
+            "time_estimate": "40 minutes"
+        },
+        {
+            "step": 3,
+            "lesson_id": 3,
+            "title": "Encapsulation",
+            "difficulty": "intermediate",
+            "time_estimate": "40 minutes"
+        },
+        {
+            "step": 4,
+            "lesson_id": 4,
+            "title": "Polymorphism",
+            "difficulty": "advanced",
+            "time_estimate": "45 minutes"
+        },
+        {
+            "step": 5,
+            "lesson_id": 5,
+            "title": "Abstraction",
+            "difficulty": "advanced",
+            "time_estimate": "45 minutes"
+        }
+    ]
+}
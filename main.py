@@ -1,533 +1,365 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from typing import List, Optional
-from enum import Enum
+import sys
+from collections import Counter
+from functools import lru_cache
+import gzip
+import hashlib
+import brotli
+import orjson
+
+from models import Difficulty, Lesson, Quiz, QuizResult, QuizSubmission
+from data import lessons_db, quizzes_db, learning_path
 
 app = FastAPI(
     title="OOP Learning API",
     description="An educational API to learn Object-Oriented Programming concepts",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 
-# ============== MODELS ==============
-
-class Difficulty(str, Enum):
-    BEGINNER = "beginner"
-    INTERMEDIATE = "intermediate"
-    ADVANCED = "advanced"
-
-
-class Lesson(BaseModel):
-    id: int
-    title: str
-    difficulty: Difficulty
-    content: str
-    code_example: str
-    key_concepts: List[str]
-
-
-class QuizQuestion(BaseModel):
-    id: int
-    question: str
-    options: List[str]
-    correct_answer: int
-    explanation: str
-
-
-class Quiz(BaseModel):
-    id: int
-    lesson_id: int
-    title: str
-    questions: List[QuizQuestion]
-
-
-class QuizAnswer(BaseModel):
-    question_id: int
-    answer: int
-
-
-class QuizSubmission(BaseModel):
-    answers: List[QuizAnswer]
-
-
-class QuizResult(BaseModel):
-    score: int
-    total: int
-    percentage: float
-    passed: bool
-    feedback: List[str]
-
-
-# ============== DATA ==============
-
-lessons_db = [
-    Lesson(
-        id=1,
-        title="Introduction to Classes and Objects",
-        difficulty=Difficulty.BEGINNER,
-        content="""
-Classes are blueprints for creating objects. An object is an instance of a class.
-A class defines attributes (data) and methods (functions) that objects of that class will have.
-
-Key Points:
-- A class is a template
-- An object is a concrete instance created from a class
-- Classes group related data and behavior together
-- This helps organize code and make it reusable
-        """,
-        code_example="""
-class Dog:
-    def __init__(self, name, age):
-        self.name = name
-        self.age = age
-
-    def bark(self):
-        return f"{self.name} says: Woof!"
-
-# Creating objects (instances)
-dog1 = Dog("Buddy", 3)
-dog2 = Dog("Max", 5)
-
-print(dog1.bark())  # Output: Buddy says: Woof!
-print(dog2.bark())  # Output: Max says: Woof!
-        """,
-        key_concepts=["Class", "Object", "Instance", "Attributes", "Methods", "Constructor"]
-    ),
-    Lesson(
-        id=2,
-        title="Inheritance",
-        difficulty=Difficulty.INTERMEDIATE,
-        content="""
-Inheritance allows a class to inherit attributes and methods from another class.
-The class being inherited from is called the parent (or base) class.
-The class that inherits is called the child (or derived) class.
-
-Benefits:
-- Code reusability: avoid repeating code
-- Logical structure: represent real-world relationships
-- Polymorphism: child classes can override parent methods
-        """,
-        code_example="""
-class Animal:
-    def __init__(self, name):
-        self.name = name
-
-    def make_sound(self):
-        return "Some generic sound"
-
-class Dog(Animal):
-    def make_sound(self):
-        return f"{self.name} says: Woof!"
-
-class Cat(Animal):
-    def make_sound(self):
-        return f"{self.name} says: Meow!"
-
-# Both inherit from Animal
-dog = Dog("Buddy")
-cat = Cat("Whiskers")
-
-print(dog.make_sound())  # Buddy says: Woof!
-print(cat.make_sound())  # Whiskers says: Meow!
-        """,
-        key_concepts=["Inheritance", "Parent Class", "Child Class", "Override", "super()"]
-    ),
-    Lesson(
-        id=3,
-        title="Encapsulation",
-        difficulty=Difficulty.INTERMEDIATE,
-        content="""
-Encapsulation is the bundling of data (attributes) and methods into a single unit (class).
-It also involves hiding internal details from the outside world using access modifiers.
-
-In Python:
-- Public: accessible from anywhere (no prefix)
-- Protected: intended for internal use (_prefix)
-- Private: not accessible outside the class (__prefix)
-
-Benefits:
-- Data protection: control how data is accessed and modified
-- Data hiding: expose only necessary interfaces
-- Maintainability: change internal implementation without affecting external code
-        """,
-        code_example="""
-class BankAccount:
-    def __init__(self, balance):
-        self.__balance = balance  # Private attribute
-
-    def deposit(self, amount):
-        if amount > 0:
-            self.__balance += amount
-            return f"Deposited: ${amount}"
-        return "Invalid amount"
-
-    def withdraw(self, amount):
-        if 0 < amount <= self.__balance:
-            self.__balance -= amount
-            return f"Withdrew: ${amount}"
-        return "Insufficient funds"
-
-    def get_balance(self):
-        return self.__balance
-
-account = BankAccount(1000)
-print(account.deposit(500))  # Deposited: $500
-print(account.get_balance())  # 1500
-# account.__balance = -1000  # Error: Cannot access private attribute
-        """,
-        key_concepts=["Encapsulation", "Access Modifiers", "Private", "Protected", "Public", "Getters", "Setters"]
-    ),
-    Lesson(
-        id=4,
-        title="Polymorphism",
-        difficulty=Difficulty.ADVANCED,
-        content="""
-Polymorphism means "many forms". It allows objects of different types to be treated as objects of a common parent type.
-There are two main types: compile-time (method overloading) and runtime (method overriding).
-
-Benefits:
-- Write flexible and reusable code
-- Use a single interface for different data types
-- Makes code extensible and maintainable
-        """,
-        code_example="""
-class Shape:
-    def area(self):
-        pass
-
-class Circle(Shape):
-    def __init__(self, radius):
-        self.radius = radius
-
-    def area(self):
-        return 3.14 * self.radius ** 2
-
-class Rectangle(Shape):
-    def __init__(self, width, height):
-        self.width = width
-        self.height = height
-
-    def area(self):
-        return self.width * self.height
-
-# Polymorphism in action
-shapes = [Circle(5), Rectangle(4, 6)]
-
-for shape in shapes:
-    print(f"Area: {shape.area()}")  # Calls appropriate method
-        """,
-        key_concepts=["Polymorphism", "Method Overriding", "Interface", "Dynamic Dispatch"]
-    ),
-    Lesson(
-        id=5,
-        title="Abstraction",
-        difficulty=Difficulty.ADVANCED,
-        content="""
-Abstraction is the concept of hiding complex implementation details and showing only the necessary features.
-It focuses on what an object does rather than how it does it.
-
-In Python, we use abstract classes and abstract methods to enforce abstraction.
-
-Benefits:
-- Reduce complexity by hiding implementation details
-- Define a clear interface for subclasses
-- Enforce consistency across implementations
-        """,
-        code_example="""
-from abc import ABC, abstractmethod
-
-class Vehicle(ABC):
-    @abstractmethod
-    def start(self):
-        pass
-
-    @abstractmethod
-    def stop(self):
-        pass
-
-class Car(Vehicle):
-    def start(self):
-        return "Car engine started"
-
-    def stop(self):
-        return "Car engine stopped"
-
-class Bike(Vehicle):
-    def start(self):
-        return "Bike engine started"
-
-    def stop(self):
-        return "Bike engine stopped"
-
-# Cannot instantiate abstract class
-# vehicle = Vehicle()  # Error
-
-car = Car()
-print(car.start())  # Car engine started
-        """,
-        key_concepts=["Abstraction", "Abstract Class", "Abstract Method", "ABC", "Interface"]
-    )
+# ============== LOOKUP INDEXES ==============
+
+_QUIZZES_BY_ID = {q.id: q for q in quizzes_db}
+
+# quiz id -> {question id -> (correct answer, explanation)}
+_ANSWER_KEY = {
+    q.id: {qq.id: (qq.correct_answer, qq.explanation) for qq in q.questions}
+    for q in quizzes_db
+}
+
+# Feedback prefix indexed by whether the answer was correct
+_FEEDBACK_PREFIX = ("✗ Incorrect.", "✓ Correct!")
+
+# Lowercased copies of the searchable text, so search_lessons doesn't
+# re-lowercase every lesson on every request.
+_SEARCH_INDEX = [
+    (l, l.title.lower(), l.content.lower(), [(c, sys.intern(c.lower())) for c in l.key_concepts])
+    for l in lessons_db
 ]
 
-quizzes_db = [
-    Quiz(
-        id=1,
-        lesson_id=1,
-        title="Classes and Objects Quiz",
-        questions=[
-            QuizQuestion(
-                id=1,
-                question="What is a class in OOP?",
-                options=[
-                    "An instance of an object",
-                    "A blueprint for creating objects",
-                    "A method of a program",
-                    "A type of variable"
-                ],
-                correct_answer=1,
-                explanation="A class is a blueprint or template that defines the structure and behavior for objects."
-            ),
-            QuizQuestion(
-                id=2,
-                question="What is an object?",
-                options=[
-                    "A collection of variables",
-                    "An instance of a class",
-                    "A function definition",
-                    "A data type"
-                ],
-                correct_answer=1,
-                explanation="An object is a concrete instance created from a class. It has actual values for the attributes defined in the class."
-            ),
-            QuizQuestion(
-                id=3,
-                question="What does __init__ do in a class?",
-                options=[
-                    "Initializes the program",
-                    "Deletes an object",
-                    "Constructs and initializes a new object",
-                    "Returns a value"
-                ],
-                correct_answer=2,
-                explanation="__init__ is the constructor method that initializes a new object when it's created."
-            )
-        ]
-    ),
-    Quiz(
-        id=2,
-        lesson_id=2,
-        title="Inheritance Quiz",
-        questions=[
-            QuizQuestion(
-                id=1,
-                question="What is inheritance?",
-                options=[
-                    "Passing money to children",
-                    "A child class inheriting attributes and methods from a parent class",
-                    "Creating multiple objects",
-                    "Copying code from one file to another"
-                ],
-                correct_answer=1,
-                explanation="Inheritance allows a class (child) to inherit attributes and methods from another class (parent)."
-            ),
-            QuizQuestion(
-                id=2,
-                question="What is the main benefit of inheritance?",
-                options=[
-                    "It makes code longer",
-                    "It helps organize imports",
-                    "Code reusability and logical structure",
-                    "It slows down execution"
-                ],
-                correct_answer=2,
-                explanation="Inheritance promotes code reusability and creates a logical hierarchical structure."
-            )
-        ]
+
+# ============== PRE-SERIALIZED PAYLOADS ==============
+# The data above never changes at runtime, so the static endpoints serve
+# bytes encoded once at import instead of re-encoding on every request.
+
+_ROOT_JSON = orjson.dumps({
+    "message": "Welcome to OOP Learning API",
+    "version": "1.0.0",
+    "endpoints": {
+        "lessons": "/lessons",
+        "lesson_by_id": "/lessons/{lesson_id}",
+        "lessons_by_difficulty": "/lessons/difficulty/{difficulty}",
+        "quizzes": "/quizzes",
+        "quiz": "/quizzes/{quiz_id}",
+        "submit_quiz": "/quizzes/{quiz_id}/submit"
+    }
+})
+
+_ALL_LESSONS_JSON = orjson.dumps([l.model_dump() for l in lessons_db])
+
+_LESSONS_BY_DIFF_JSON = {
+    d: orjson.dumps([l.model_dump() for l in lessons_db if l.difficulty == d])
+    for d in Difficulty
+}
+
+_LESSON_JSON_BY_ID = {l.id: orjson.dumps(l.model_dump()) for l in lessons_db}
+
+_ALL_QUIZZES_JSON = orjson.dumps([q.model_dump() for q in quizzes_db])
+
+_QUIZ_JSON_BY_ID = {q.id: orjson.dumps(q.model_dump()) for q in quizzes_db}
+
+_QUIZZES_BY_LESSON_JSON = {
+    lesson_id: orjson.dumps([q.model_dump() for q in quizzes_db if q.lesson_id == lesson_id])
+    for lesson_id in {q.lesson_id for q in quizzes_db}
+}
+
+_EMPTY_LIST_JSON = orjson.dumps([])
+
+_LEARNING_PATH_JSON = orjson.dumps(learning_path)
+
+
+def _build_progress_summary() -> bytes:
+    """Serialize the lesson and quiz totals"""
+    by_difficulty = Counter(l.difficulty for l in lessons_db)
+    return orjson.dumps({
+        "total_lessons": len(lessons_db),
+        "lessons_by_difficulty": {d.value: by_difficulty[d] for d in Difficulty},
+        "total_quizzes": len(quizzes_db),
+        "total_quiz_questions": sum(len(q.questions) for q in quizzes_db)
+    })
+
+
+_PROGRESS_SUMMARY_JSON = _build_progress_summary()
+
+
+# ============== PRE-BUILT RESPONSES ==============
+# One Response object per static payload, built at import and returned as-is
+# by every request. Starlette sends a Response without mutating it, but
+# FastAPI assigns a returned Response's `background` when it is None, so a
+# shared Response would keep the first request's BackgroundTasks and re-run
+# them on every later request. _shared_response pins `background` to an
+# empty BackgroundTasks so FastAPI never assigns it; routes serving these
+# responses must not rely on BackgroundTasks dependencies.
+# The large list payloads are also compressed once, so clients that accept
+# br or gzip get fewer bytes on the wire at no per-request cost.
+
+def _shared_response(body: bytes = b"", status_code: int = 200, headers: Optional[dict] = None,
+                     media_type: Optional[str] = "application/json") -> Response:
+    return Response(
+        content=body,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+        background=BackgroundTasks()
     )
-]
+
+
+def _preferred_encoding(request: Request) -> str:
+    """Pick br, then gzip, then identity, based on the Accept-Encoding header"""
+    accepted = set()
+    rejected = set()
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        _, _, q = params.partition("q=")
+        try:
+            weight = float(q) if q else 1.0
+        except ValueError:
+            continue
+        (accepted if weight > 0 else rejected).add(coding)
+    for coding in ("br", "gzip"):
+        if coding in accepted or ("*" in accepted and coding not in rejected):
+            return coding
+    return "identity"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against one ETag"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class _StaticPayload:
+    """A serialized JSON body with shared 200 and 304 responses per content coding
+
+    Each coding gets a strong ETag derived from the SHA-256 of the body, so a
+    client revalidating with a matching If-None-Match gets a 304 and no body.
+    """
+
+    def __init__(self, body: bytes, compress: bool = False):
+        encoded = {"identity": body}
+        if compress:
+            encoded["br"] = brotli.compress(body, quality=11)
+            encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        digest = hashlib.sha256(body).hexdigest()[:16]
+
+        self.compress = compress
+        self.etags = {}
+        self.responses = {}
+        self.not_modified = {}
+        for coding, content in encoded.items():
+            etag = f'"{digest}"' if coding == "identity" else f'"{digest}-{coding}"'
+            headers = {"ETag": etag}
+            if compress:
+                headers["Vary"] = "Accept-Encoding"
+            self.etags[coding] = etag
+            self.not_modified[coding] = _shared_response(status_code=304, headers=headers, media_type=None)
+            if coding != "identity":
+                headers = {**headers, "Content-Encoding": coding}
+            self.responses[coding] = _shared_response(content, headers=headers)
+
+    def respond(self, request: Request) -> Response:
+        coding = _preferred_encoding(request) if self.compress else "identity"
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and _etag_matches(if_none_match, self.etags[coding]):
+            return self.not_modified[coding]
+        return self.responses[coding]
+
+
+_ALL_LESSONS_PAYLOAD = _StaticPayload(_ALL_LESSONS_JSON, compress=True)
+
+_ALL_QUIZZES_PAYLOAD = _StaticPayload(_ALL_QUIZZES_JSON, compress=True)
+
+_LESSONS_BY_DIFF_PAYLOAD = {d: _StaticPayload(body) for d, body in _LESSONS_BY_DIFF_JSON.items()}
+
+_LESSON_PAYLOAD_BY_ID = {
+    lesson_id: _StaticPayload(body) for lesson_id, body in _LESSON_JSON_BY_ID.items()
+}
+
+_QUIZ_PAYLOAD_BY_ID = {quiz_id: _StaticPayload(body) for quiz_id, body in _QUIZ_JSON_BY_ID.items()}
+
+_QUIZZES_BY_LESSON_PAYLOAD = {
+    lesson_id: _StaticPayload(body) for lesson_id, body in _QUIZZES_BY_LESSON_JSON.items()
+}
+
+_EMPTY_LIST_PAYLOAD = _StaticPayload(_EMPTY_LIST_JSON)
 
 
 # ============== ENDPOINTS ==============
+# Every handler (and any future dependency, e.g. auth) is declared
+# `async def` and must not block: FastAPI runs plain `def` endpoints and
+# dependencies in a threadpool, which costs a thread hop per request. All
+# model construction and serialization happens at import above, so the
+# handlers only do lookups.
 
-# @app.get("/")
-# async def root():
-#     """Welcome endpoint with API information"""
-#     return {
-#         "message": "Welcome to OOP Learning API",
-#         "version": "1.0.0",
-#         "endpoints": {
-#             "lessons": "/lessons",
-#             "lesson_by_id": "/lessons/{lesson_id}",
-#             "lessons_by_difficulty": "/lessons/difficulty/{difficulty}",
-#             "quizzes": "/quizzes",
-#             "quiz": "/quizzes/{quiz_id}",
-#             "submit_quiz": "/quizzes/{quiz_id}/submit"
-#         }
-#     }
+def _add_static_route(path: str, body: bytes, name: str, description: str):
+    """Register a GET route that serves one pre-built payload
 
+    The handler dispatches to a captured _StaticPayload, which picks its
+    shared 200 or 304 response for the request.
+    """
+    payload = _StaticPayload(body)
 
-# ============== LESSON ENDPOINTS ==============
+    async def endpoint(request: Request):
+        return payload.respond(request)
+
+    app.add_api_route(path, endpoint, methods=["GET"], name=name, description=description)
 
-@app.get("/lessons", response_model=List[Lesson])
-async def get_all_lessons():
-    """Get all OOP lessons"""
-    return lessons_db
 
+_add_static_route("/", _ROOT_JSON, "root", "Welcome endpoint with API information")
 
-@app.get("/lessons/{lesson_id}", response_model=Lesson)
-async def get_lesson(lesson_id: int):
+
+# ============== LESSON ENDPOINTS ==============
+
+@app.get("/lessons", responses={200: {"model": List[Lesson]}})
+async def get_all_lessons(request: Request):
+    """Get all OOP lessons"""
+    return _ALL_LESSONS_PAYLOAD.respond(request)
+
+
+def _search(keyword_lower: str) -> bytes:
+    results = [
+        {
+            "id": l.id,
+            "title": l.title,
+            "difficulty": l.difficulty,
+            "matching_concepts": [c for c, c_lower in concepts if keyword_lower in c_lower]
+        }
+        for l, title_lower, content_lower, concepts in _SEARCH_INDEX
+        if keyword_lower in title_lower or keyword_lower in content_lower
+    ]
+    return orjson.dumps(results)
+
+
+# The lessons never change at runtime, so results per keyword can be cached
+# as serialized bytes. Only keywords up to _SEARCH_CACHE_MAX_KEYWORD chars
+# are cached, so clients can't pin arbitrarily large keys in memory. If
+# lessons_db is ever mutated, both _SEARCH_INDEX and this cache must be
+# rebuilt, since the index holds lowercased copies made at import.
+_SEARCH_CACHE_MAX_KEYWORD = 64
+
+_cached_search = lru_cache(maxsize=1024)(_search)
+
+
+@app.get("/lessons/search")
+async def search_lessons(keyword: str):
+    """Search lessons by keyword"""
+    keyword_lower = keyword.lower()
+    if len(keyword_lower) <= _SEARCH_CACHE_MAX_KEYWORD:
+        body = _cached_search(keyword_lower)
+    else:
+        body = _search(keyword_lower)
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/lessons/{lesson_id}", responses={200: {"model": Lesson}})
+async def get_lesson(lesson_id: int, request: Request):
     """Get a specific lesson by ID"""
-    lesson = next((l for l in lessons_db if l.id == lesson_id), None)
-    if not lesson:
+    payload = _LESSON_PAYLOAD_BY_ID.get(lesson_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Lesson not found")
-    return {"MESSAGE" : "THIS IS BROKEN"}
+    return payload.respond(request)
 
 
-@app.get("/lessons/difficulty/{difficulty}", response_model=List[Lesson])
-async def get_lessons_by_difficulty(difficulty: Difficulty):
+@app.get("/lessons/difficulty/{difficulty}", responses={200: {"model": List[Lesson]}})
+async def get_lessons_by_difficulty(difficulty: Difficulty, request: Request):
     """Get lessons filtered by difficulty level"""
-    filtered = [l for l in lessons_db if l.difficulty == difficulty]
-    return {"MESSAGE" : "THIS IS BROKEN"}
-
-
-# @app.get("/lessons/search")
-# async def search_lessons(keyword: str):
-#     """Search lessons by keyword"""
-#     keyword_lower = keyword.lower()
-#     results = [
-#         {
-#             "id": l.id,
-#             "title": l.title,
-#             "difficulty": l.difficulty,
-#             "matching_concepts": [c for c in l.key_concepts if keyword_lower in c.lower()]
-#         }
-#         for l in lessons_db
-#         if keyword_lower in l.title.lower() or keyword_lower in l.content.lower()
-#     ]
-#     return results
+    return _LESSONS_BY_DIFF_PAYLOAD[difficulty].respond(request)
 
 
 # ============== QUIZ ENDPOINTS ==============
 
-@app.get("/quizzes", response_model=List[Quiz])
-async def get_all_quizzes():
+@app.get("/quizzes", responses={200: {"model": List[Quiz]}})
+async def get_all_quizzes(request: Request):
     """Get all available quizzes"""
-    return quizzes_db
+    return _ALL_QUIZZES_PAYLOAD.respond(request)
 
 
-@app.get("/quizzes/{quiz_id}", response_model=Quiz)
-async def get_quiz(quiz_id: int):
+@app.get("/quizzes/{quiz_id}", responses={200: {"model": Quiz}})
+async def get_quiz(quiz_id: int, request: Request):
     """Get a specific quiz by ID"""
-    quiz = next((q for q in quizzes_db if q.id == quiz_id), None)
-    if not quiz:
+    payload = _QUIZ_PAYLOAD_BY_ID.get(quiz_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Quiz not found")
-    return {"MESSAGE" : "THIS IS BROKEN"}
+    return payload.respond(request)
 
 
-@app.get("/quizzes/lesson/{lesson_id}", response_model=List[Quiz])
-async def get_quizzes_for_lesson(lesson_id: int):
+@app.get("/quizzes/lesson/{lesson_id}", responses={200: {"model": List[Quiz]}})
+async def get_quizzes_for_lesson(lesson_id: int, request: Request):
     """Get all quizzes for a specific lesson"""
-    quizzes = [q for q in quizzes_db if q.lesson_id == lesson_id]
-    return quizzes
+    return _QUIZZES_BY_LESSON_PAYLOAD.get(lesson_id, _EMPTY_LIST_PAYLOAD).respond(request)
 
 
-@app.post("/quizzes/{quiz_id}/submit", response_model=QuizResult)
+@app.post("/quizzes/{quiz_id}/submit", responses={200: {"model": QuizResult}})
 async def submit_quiz(quiz_id: int, submission: QuizSubmission):
     """Submit quiz answers and get results"""
-    quiz = next((q for q in quizzes_db if q.id == quiz_id), None)
+    quiz = _QUIZZES_BY_ID.get(quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
+    key = _ANSWER_KEY[quiz_id]
     score = 0
     feedback = []
 
     for answer in submission.answers:
-        question = next((q for q in quiz.questions if q.id == answer.question_id), None)
-        if not question:
+        correct_answer, explanation = key.get(answer.question_id, (None, None))
+        if correct_answer is None:
             continue
 
-        if answer.answer == question.correct_answer:
-            score += 1
-            feedback.append(f"Q{answer.question_id}: ✓ Correct! {question.explanation}")
-        else:
-            feedback.append(f"Q{answer.question_id}: ✗ Incorrect. {question.explanation}")
+        correct = answer.answer == correct_answer
+        score += correct
+        feedback.append(f"Q{answer.question_id}: {_FEEDBACK_PREFIX[correct]} {explanation}")
 
     total = len(quiz.questions)
     percentage = (score / total * 100) if total > 0 else 0
     passed = percentage >= 70
 
-    return QuizResult(
+    return ORJSONResponse(QuizResult(
         score=score,
         total=total,
         percentage=round(percentage, 2),
         passed=passed,
         feedback=feedback
-    )
+    ).model_dump())
 
 
 # ============== PROGRESS TRACKING ==============
 
-@app.get("/progress/summary")
-async def get_progress_summary():
-    """Get summary of available lessons and quizzes"""
-    return {
-        "total_lessons": len(lessons_db),
-        "lessons_by_difficulty": {
-            "beginner": len([l for l in lessons_db if l.difficulty == Difficulty.BEGINNER]),
-            "intermediate": len([l for l in lessons_db if l.difficulty == Difficulty.INTERMEDIATE]),
-            "advanced": len([l for l in lessons_db if l.difficulty == Difficulty.ADVANCED])
-        },
-        "total_quizzes": len(quizzes_db),
-        "total_quiz_questions": sum(len(q.questions) for q in quizzes_db)
-    }
+_add_static_route(
+    "/progress/summary",
+    _PROGRESS_SUMMARY_JSON,
+    "get_progress_summary",
+    "Get summary of available lessons and quizzes"
+)
 
 
 # ============== LEARNING PATH ==============
 
-@app.get("/learning-path")
-async def get_learning_path():
-    """Get recommended learning path for OOP"""
-    return {
-        "title": "Complete OOP Learning Path",
-        "description": "A recommended progression to learn OOP concepts",
-        "path": [
-            {
-                "step": 1,
-                "lesson_id": 1,
-                "title": "Introduction to Classes and Objects",
-                "difficulty": "beginner",
-                "time_estimate": "30 minutes"
-            },
-            {
-                "step": 2,
-                "lesson_id": 2,
-                "title": "Inheritance",
-                "difficulty": "intermediate",
-                "time_estimate": "40 minutes"
-            },
-            {
-                "step": 3,
-                "lesson_id": 3,
-                "title": "Encapsulation",
-                "difficulty": "intermediate",
-                "time_estimate": "40 minutes"
-            },
-            {
-                "step": 4,
-                "lesson_id": 4,
-                "title": "Polymorphism",
-                "difficulty": "advanced",
-                "time_estimate": "45 minutes"
-            },
-            {
-                "step": 5,
-                "lesson_id": 5,
-                "title": "Abstraction",
-                "difficulty": "advanced",
-                "time_estimate": "45 minutes"
-            }
-        ]
-    }
+_add_static_route(
+    "/learning-path",
+    _LEARNING_PATH_JSON,
+    "get_learning_path",
+    "Get recommended learning path for OOP"
+)
+
 
+if __name__ == "__main__":
+    import uvicorn
 
+    uvicorn.run("main:app", host="0.0.0.0", port=8000)
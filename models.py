@@ -0,0 +1,64 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List
+from enum import Enum
+
+
+# ============== MODELS ==============
+
+class Difficulty(str, Enum):
+    BEGINNER = "beginner"
+    INTERMEDIATE = "intermediate"
+    ADVANCED = "advanced"
+
+
+class Lesson(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    title: str
+    difficulty: Difficulty
+    content: str
+    code_example: str
+    key_concepts: List[str]
+
+
+class QuizQuestion(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    question: str
+    options: List[str]
+    correct_answer: int
+    explanation: str
+
+
+class Quiz(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    lesson_id: int
+    title: str
+    questions: List[QuizQuestion]
+
+
+class QuizAnswer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    question_id: int
+    answer: int
+
+
+class QuizSubmission(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    answers: List[QuizAnswer]
+
+
+class QuizResult(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    score: int
+    total: int
+    percentage: float
+    passed: bool
+    feedback: List[str]